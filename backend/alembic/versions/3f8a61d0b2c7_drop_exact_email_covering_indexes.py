@@ -0,0 +1,33 @@
+"""Drop exact-email covering indexes
+
+Revision ID: 3f8a61d0b2c7
+Revises: 7c2d9e4f1a38
+Create Date: 2026-10-16 22:41:53.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a61d0b2c7'
+down_revision: Union[str, Sequence[str], None] = '7c2d9e4f1a38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Email lookups all go through lower(email) now, and its unique index already enforces uniqueness
+    op.drop_index('ix_admins_email_covering', table_name='admins', postgresql_include=['id', 'name'])
+    op.drop_index('ix_doctors_email_covering', table_name='doctors', postgresql_include=['id', 'name'])
+    op.drop_index('ix_patients_email_covering', table_name='patients', postgresql_include=['id', 'name'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_patients_email_covering', 'patients', ['email'], unique=True, postgresql_include=['id', 'name'])
+    op.create_index('ix_doctors_email_covering', 'doctors', ['email'], unique=True, postgresql_include=['id', 'name'])
+    op.create_index('ix_admins_email_covering', 'admins', ['email'], unique=True, postgresql_include=['id', 'name'])
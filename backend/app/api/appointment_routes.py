@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 from ..schemas.appointment_schema import AppointmentCreate, AppointmentUpdate, AppointmentResponse
 
 # Dependency to get DB session from context
-from ..db.database_session_manager import DatabaseSessionManager
+from ..db.database_session_manager import db_manager
 
 # Service function to get appointment by id
 from ..services.appointment.get_appointment_by_id_service import GetAppointmentByIDService
@@ -52,7 +52,7 @@ router = APIRouter(
 async def get_appointment(
     appointment_id: int,
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(DatabaseSessionManager().get_db)
+    db: Session = Depends(db_manager.get_db)
 ):
     return await GetAppointmentByIDService(db).get_appointment_by_id(appointment_id, token)
 
@@ -68,7 +68,7 @@ async def get_appointment(
 async def create_appointment(
     appointment: AppointmentCreate,
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(DatabaseSessionManager().get_db)
+    db: Session = Depends(db_manager.get_db)
 ):
     return await CreateAppointmentService(db).create_appointment(appointment, token)
 
@@ -84,7 +84,7 @@ async def update_appointment(
     appointment_id: int,
     appointment_update: AppointmentUpdate,
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(DatabaseSessionManager().get_db)
+    db: Session = Depends(db_manager.get_db)
 ):
     return await UpdateAppointmentService(db).update_appointment(appointment_id, appointment_update, token)
 
@@ -99,7 +99,7 @@ async def update_appointment(
 async def delete_appointment(
     appointment_id: int,
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(DatabaseSessionManager().get_db)
+    db: Session = Depends(db_manager.get_db)
 ):
     return await DeleteAppointmentService(db).delete_appointment(appointment_id, token)
 
@@ -113,6 +113,6 @@ async def delete_appointment(
 
 async def get_all_appointments(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(DatabaseSessionManager().get_db)
+    db: Session = Depends(db_manager.get_db)
 ):
     return await GetAllAppointmentsService(db).get_all_appointments(token)
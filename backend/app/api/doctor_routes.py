@@ -1,6 +1,6 @@
 # ---------------------------- External Imports ----------------------------
 # Import FastAPI core components for routing, dependency injection, and HTTP status codes
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 # Import Session class for database operations using SQLAlchemy ORM
 from sqlalchemy.orm import Session
@@ -13,7 +13,7 @@ from fastapi.security import OAuth2PasswordBearer
 from ..schemas.doctor_schema import DoctorCreate, DoctorRead, DoctorUpdate, DoctorDeleteResponse
 
 # Import the function to retrieve a database session via dependency injection
-from ..db.database_session_manager import DatabaseSessionManager
+from ..db.database_session_manager import db_manager
 
 # Import service function to retrieve a doctor by ID
 from ..services.doctor.get_doctor_by_id_service import GetDoctorByIdService
@@ -51,7 +51,7 @@ router = APIRouter(
 async def get_doctor(
     doctor_id: int,                             # Doctor's unique identifier from the path
     token: str = Depends(oauth2_scheme),        # Extract token using OAuth2
-    db: Session = Depends(DatabaseSessionManager().get_db)               # Inject database session
+    db: Session = Depends(db_manager.get_db)    # Inject database session
 ):
     """
     Retrieve a doctor by their ID.
@@ -71,7 +71,7 @@ async def get_doctor(
 async def create_doctor(
     doctor: DoctorCreate,                       # Doctor creation payload validated via Pydantic
     token: str = Depends(oauth2_scheme),        # Extract token from Authorization header
-    db: Session = Depends(DatabaseSessionManager().get_db)               # Inject SQLAlchemy session
+    db: Session = Depends(db_manager.get_db)    # Inject SQLAlchemy session
 ):
     """
     Create a new doctor (Admin only).
@@ -91,7 +91,7 @@ async def update_doctor(
     doctor_id: int,                             # Doctor's unique identifier from the path
     updated_doctor: DoctorUpdate,              # Updated data validated via Pydantic schema
     token: str = Depends(oauth2_scheme),        # Extract token from the request
-    db: Session = Depends(DatabaseSessionManager().get_db)               # Inject database session
+    db: Session = Depends(db_manager.get_db)    # Inject database session
 ):
     """
     Update a doctor (Admin only).
@@ -110,7 +110,7 @@ async def update_doctor(
 async def delete_doctor(
     doctor_id: int,                             # ID of the doctor to delete
     token: str = Depends(oauth2_scheme),        # Extract token for authorization
-    db: Session = Depends(DatabaseSessionManager().get_db)               # Inject database session
+    db: Session = Depends(db_manager.get_db)    # Inject database session
 ):
     """
     Delete a doctor (Admin only).
@@ -127,13 +127,22 @@ async def delete_doctor(
             )
 
 async def get_all_doctors(
+    response: Response,                         # Outgoing response, used to expose the next-page cursor
+    after_id: int | None = Query(None, description="Return doctors with ID greater than this cursor"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of doctors per page"),
     token: str = Depends(oauth2_scheme),        # Extract token to identify requester
-    db: Session = Depends(DatabaseSessionManager().get_db)               # Inject database session
+    db: Session = Depends(db_manager.get_db)    # Inject database session
 ):
     """
-    Retrieve all doctors.
+    Retrieve a page of doctors ordered by ID.
     - Admins & patients: see all.
     - Doctors: see only self.
+    The `X-Next-After` header carries the cursor for the next page when more doctors exist.
     """
     # Delegate logic to service layer to retrieve doctors list
-    return await GetAllDoctorsService(db).get_all_doctors(token)
+    doctors, next_after = await GetAllDoctorsService(db).get_all_doctors(token, after_id, limit)
+
+    # Expose the keyset cursor so clients can request the following page
+    if next_after is not None:
+        response.headers["X-Next-After"] = str(next_after)
+    return doctors
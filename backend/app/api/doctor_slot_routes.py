@@ -10,7 +10,7 @@ from fastapi.security import OAuth2PasswordBearer
 
 # ---------------------------- Internal Imports ----------------------------
 # Dependency to get a database session
-from ..db.database_session_manager import DatabaseSessionManager
+from ..db.database_session_manager import db_manager
 
 # Import the modular service to get available slots
 from ..services.doctor_slot.doctor_slot_availability_service import DoctorSlotAvailabilityService
@@ -37,7 +37,7 @@ async def get_available_slots(
     doctor_id: int,                                     # Doctor's unique ID passed as a path parameter
     date_str: str = Query(..., description="Date in YYYY-MM-DD"),  # Target date for slot query (required query param)
     token: str = Depends(oauth2_scheme),                # Extract the bearer token from request headers
-    db: Session = Depends(DatabaseSessionManager().get_db)                       # Inject a database session into the route
+    db: Session = Depends(db_manager.get_db)            # Inject a database session into the route
 ):
     """
     Returns a list of available slot start times (as strings) for a doctor
@@ -1,6 +1,6 @@
 # ---------------------------- External Imports ----------------------------
 # FastAPI core components for building routes, handling requests, and raising exceptions
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 # SQLAlchemy session class for database operations
 from sqlalchemy.orm import Session
@@ -10,7 +10,7 @@ from fastapi.security import OAuth2PasswordBearer
 
 # ---------------------------- Internal Imports ----------------------------
 # Import database session provider function
-from ..db.database_session_manager import DatabaseSessionManager
+from ..db.database_session_manager import db_manager
 
 # Pydantic schemas for request and response validation
 from ..schemas.patient_schema import (
@@ -57,7 +57,7 @@ router = APIRouter(
 async def get_patient(
     patient_id: int,                                # Patient ID from path
     token: str = Depends(oauth2_scheme),            # Extract token from header
-    db: Session = Depends(DatabaseSessionManager().get_db)                   # Inject DB session
+    db: Session = Depends(db_manager.get_db)        # Inject DB session
 ):
     """
     Get a patient's profile by ID.
@@ -78,7 +78,7 @@ async def get_patient(
 async def create_patient(
     patient: PatientCreate,                         # Payload for creating patient
     token: str = Depends(oauth2_scheme),            # Extract token from header
-    db: Session = Depends(DatabaseSessionManager().get_db)                   # Inject DB session
+    db: Session = Depends(db_manager.get_db)        # Inject DB session
 ):
     # Call the modular service to handle patient creation
     return await CreatePatientService(db).create_patient(patient, token)
@@ -95,7 +95,7 @@ async def update_patient(
     patient_id: int,                                # ID of patient to update
     update_data: PatientUpdate,                     # Update data as Pydantic model
     token: str = Depends(oauth2_scheme),            # Extract token from header
-    db: Session = Depends(DatabaseSessionManager().get_db)                   # Inject DB session
+    db: Session = Depends(db_manager.get_db)        # Inject DB session
 ):
     # Call the modular service to handle patient update logic
     return await UpdatePatientService(db).update_patient(patient_id, update_data, token)
@@ -111,7 +111,7 @@ async def update_patient(
 async def delete_patient(
     patient_id: int,                                # ID of patient to delete
     token: str = Depends(oauth2_scheme),            # Extract token from header
-    db: Session = Depends(DatabaseSessionManager().get_db)                   # Inject DB session
+    db: Session = Depends(db_manager.get_db)        # Inject DB session
 ):
     """
     Delete a patient by ID.
@@ -129,12 +129,21 @@ async def delete_patient(
             )
 
 async def get_all_patients(
+    response: Response,                             # Outgoing response, used to expose the next-page cursor
+    after_id: int | None = Query(None, description="Return patients with ID greater than this cursor"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of patients per page"),
     token: str = Depends(oauth2_scheme),            # Extract token from header
-    db: Session = Depends(DatabaseSessionManager().get_db)                   # Inject DB session
+    db: Session = Depends(db_manager.get_db)        # Inject DB session
 ):
     """
-    Get all patient records.
+    Get a page of patient records ordered by ID.
     Admins see all; regular patients see only their own info.
+    The `X-Next-After` header carries the cursor for the next page when more patients exist.
     """
     # Call the modular service to return one or more patients based on role
-    return await GetAllPatientsService(db).get_all_patients(token)
+    patients, next_after = await GetAllPatientsService(db).get_all_patients(token, after_id, limit)
+
+    # Expose the keyset cursor so clients can request the following page
+    if next_after is not None:
+        response.headers["X-Next-After"] = str(next_after)
+    return patients
@@ -1,142 +1,172 @@
 # ---------------------------- External Imports ----------------------------
 # FastAPI tools for routing, dependencies, and HTTP errors
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 
-# Response classes for JSON output and redirection
-from fastapi.responses import JSONResponse, RedirectResponse
+# Run blocking DB calls in a worker thread so the event loop stays free
+from fastapi.concurrency import run_in_threadpool
+
+# Response class for redirection
+from fastapi.responses import RedirectResponse
 
 # SQLAlchemy session for interacting with the database
 from sqlalchemy.orm import Session
 
-# To handle JWT decoding and verification errors
-from jose import JWTError
-
 # To extract Bearer token from Authorization header
 from fastapi.security import OAuth2PasswordBearer
 
+# To build and percent-encode the OAuth query string
+from urllib.parse import quote, urlencode
+
+# Standard logging for background task failures
+import logging
+
 # ---------------------------- Internal Imports ----------------------------
 # Internal utility functions for Google auth and JWT
-from .auth_utils import AuthUtils
+from .auth_utils import AuthUtils, ROLE_MODELS
 
 # Application-wide settings from environment
 from ..core.settings import settings
 
-# Admin model from the database
-from ..models.admin_model import Admin
-
-# Doctor model from the database
-from ..models.doctor_model import Doctor
-
-# Patient model from the database
-from ..models.patient_model import Patient
-
 # Dependency for getting DB session
-from ..db.database_session_manager import DatabaseSessionManager
+from ..db.database_session_manager import db_manager
 
 # For checking and generating access token
 from .google_token_service import GoogleTokenService
 
+# Doctor list service, whose cached pages include doctors' Google tokens
+from ..services.doctor.get_all_doctors_service import GetAllDoctorsService
+
+# ---------------------------- Logger ----------------------------
+# Module logger for auth routes
+logger = logging.getLogger(__name__)
+
 # ---------------------------- Router & OAuth Setup ----------------------------
 # Set up FastAPI's OAuth2PasswordBearer to extract token from Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Same extractor but without a 401 when the header is missing (logout must always succeed)
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
+
 # Create a FastAPI router instance with prefix and tags
 router = APIRouter(
     prefix="/auth",
     tags=["Authentication"]
 )
 
+# Google OAuth2 consent URL, built once since it depends only on settings
+_GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth?" + urlencode(
+    {
+        "response_type": "code",
+        "client_id": settings.GOOGLE_CLIENT_ID,
+        "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+        "scope": settings.GOOGLE_SCOPES.replace(",", " "),
+        "access_type": "offline",
+        "include_granted_scopes": "true",
+        "prompt": "consent",
+    },
+    quote_via=quote,  # Encode spaces in scopes as %20 rather than '+'
+)
+
+# Frontend redirect after login; the issued JWT is appended to this prefix
+_FRONTEND_TOKEN_REDIRECT = f"{settings.FRONTEND_REDIRECT_URI}?access_token="
+
+# ------------------------ Helper: Background Google Token Refresh ------------------------
+async def _refresh_google_token_in_background(user_id: int, role: str) -> None:
+    """
+    Refreshes the user's Google access token after the response is sent,
+    using a dedicated DB session since the request-scoped one is already closed.
+    Starlette runs this task on the event loop, so every DB call goes through the threadpool
+    and only the Google HTTP refresh is awaited directly.
+    """
+    db = db_manager.SessionLocal()
+    try:
+        await GoogleTokenService.get_valid_google_access_token(user_id, role, db)
+    except Exception as e:
+        logger.warning("Background Google token refresh failed: %s", e)
+    finally:
+        # Closing returns the connection to the pool (and may roll back), so keep it off the loop too
+        await run_in_threadpool(db.close)
+
 # ------------------------ Route: Google Login Initiation ------------------------
 @router.get("/login")
-async def login_with_google(request: Request, db: Session = Depends(DatabaseSessionManager().get_db)):
+async def login_with_google():
     """
     Initiates the Google OAuth2 login flow and redirects the user to the Google login page.
     """
-    try:
-        google_oauth_url = "https://accounts.google.com/o/oauth2/v2/auth"
-        scopes = settings.GOOGLE_SCOPES
-        formatted_scopes = scopes.replace(",", "%20")
-        auth_url = (
-            f"{google_oauth_url}?response_type=code"
-            f"&client_id={settings.GOOGLE_CLIENT_ID}"
-            f"&redirect_uri={settings.GOOGLE_REDIRECT_URI}"
-            f"&scope={formatted_scopes}"
-            f"&access_type=offline"
-            f"&include_granted_scopes=true"
-            f"&prompt=consent"
-        )
-        return RedirectResponse(url=auth_url)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Google OAuth2 Authentication Failed: {str(e)}")
+    return RedirectResponse(url=_GOOGLE_AUTH_URL)
 
 # ------------------------ Route: OAuth2 Callback ------------------------
 @router.get("/callback")
-async def google_callback(code: str, db: Session = Depends(DatabaseSessionManager().get_db)):
+async def google_callback(code: str, db: Session = Depends(db_manager.get_db)):
     """
     Handles the OAuth2 callback, authenticates the user, and redirects with JWT.
     """
     try:
-        user_info = AuthUtils.authenticate_with_google(code, db)
+        # Google calls are awaited and DB writes run in the threadpool, so the event loop stays free
+        user_info = await AuthUtils.authenticate_with_google(code, db)
+
+        # Login stores fresh Google tokens, so drop the user's cached tokens (and doctor list pages for doctors)
+        GoogleTokenService.invalidate_cached_token(user_info["role"], user_info["id"])
+        if user_info["role"] == "doctor":
+            GetAllDoctorsService.invalidate_cache()
+
         jwt_token = AuthUtils.create_jwt_token(user_info)
-        redirect_url = f"{settings.FRONTEND_REDIRECT_URI}?access_token={jwt_token}"
-        return RedirectResponse(url=redirect_url)
+        return RedirectResponse(url=_FRONTEND_TOKEN_REDIRECT + jwt_token)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Google OAuth2 Authentication Failed: {str(e)}")
 
 # ------------------------ Route: Get Current Authenticated User ------------------------
 @router.get("/me")
-async def read_users_me(token: str = Depends(oauth2_scheme), db: Session = Depends(DatabaseSessionManager().get_db)):
+async def read_users_me(
+    background_tasks: BackgroundTasks,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(db_manager.get_db)
+):
     """
     Returns the authenticated user's information based on the JWT token.
-    Tries Admin → Doctor → Patient. Refreshes token for Doctor/Patient.
+    Looks up the table named by the token's role (Admin → Doctor → Patient for legacy tokens).
+    Refreshes the Google token in the background.
     """
     try:
+        # Raises a 401 HTTPException for invalid, expired, or revoked tokens
         payload = AuthUtils.verify_jwt_token(token)
         user_id = payload.get("id")
         email = payload.get("sub")
-        name = payload.get("name")
-
-        admin = db.query(Admin).filter(Admin.email == email).first() if email else None
-        if admin:
-            try:
-                await GoogleTokenService.get_valid_google_access_token(admin.id, "admin", db)
-            except Exception as e:
-                print(f"Token refresh failed: {e}")
-            return {"email": admin.email, "name": admin.name, "role": "admin"}
-
-        doctor = db.query(Doctor).filter(Doctor.id == user_id).first() if user_id else None
-        if not doctor and email:
-            doctor = db.query(Doctor).filter(Doctor.email == email).first()
-        if doctor:
-            try:
-                await GoogleTokenService.get_valid_google_access_token(doctor.id, "doctor", db)
-            except Exception as e:
-                print(f"Token refresh failed: {e}")
-            return {"email": doctor.email, "name": doctor.name, "role": "doctor"}
-
-        patient = db.query(Patient).filter(Patient.id == user_id).first() if user_id else None
-        if not patient and email:
-            patient = db.query(Patient).filter(Patient.email == email).first()
-        if patient:
-            try:
-                await GoogleTokenService.get_valid_google_access_token(patient.id, "patient", db)
-            except Exception as e:
-                print(f"Token refresh failed: {e}")
-            return {"email": patient.email, "name": patient.name, "role": "patient"}
-
-        raise HTTPException(status_code=404, detail="User not found")
-
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+        role = payload.get("role")
+
+        # Tokens carry the role, so query only that table; legacy tokens fall back to the cross-table lookup
+        if role in ROLE_MODELS:
+            user = await run_in_threadpool(AuthUtils.find_user_by_role, db, role, user_id)
+        else:
+            user = await run_in_threadpool(AuthUtils.find_user_identity, db, user_id, email)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # Keep the Google refresh off the response path, and skip it when the cached token is still fresh
+        if GoogleTokenService.needs_refresh(user.id, user.role):
+            background_tasks.add_task(_refresh_google_token_in_background, user.id, user.role)
+        return {"email": user.email, "name": user.name, "role": user.role}
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # ------------------------ Route: Logout ------------------------
 @router.post("/logout")
-async def logout():
+async def logout(token: str | None = Depends(optional_oauth2_scheme)):
     """
-    Logs out the user. Since JWT is stateless, this only tells frontend to delete token.
+    Logs out the user by revoking the presented JWT until it expires.
+    The frontend should still delete its copy of the token.
     """
-    return JSONResponse(content={
+    # Revoke the token if one was sent; invalid or expired tokens need no revocation
+    if token:
+        try:
+            AuthUtils.revoke_jwt_token(token)
+        except HTTPException:
+            pass
+
+    return {
         "message": "Successfully logged out. Please delete the token from your client (frontend)."
-    })
+    }
@@ -19,7 +19,8 @@ class AuthUserCheck:
     @staticmethod
     def get_user_from_token(token: str, db: Session) -> tuple[str, str, int]:
         """
-        Decodes JWT token, extracts email, determines user role and ID.
+        Decodes JWT token and extracts email, user role, and ID from its claims.
+        Falls back to a DB lookup for tokens issued without a role claim.
 
         Parameters:
         - token (str): OAuth2 Bearer token
@@ -37,8 +38,16 @@ class AuthUserCheck:
             if not user_email:
                 raise HTTPException(status_code=401, detail="Invalid token: no email found")
 
-            # Reuse internal logic to determine role and ID  
-            user_role, user_id = AuthUtils.determine_user_role_and_id(user_email, db)
+            # Tokens issued at login carry role and ID claims, so no DB lookup is needed  
+            user_role = payload.get("role")
+            user_id = payload.get("id")
+
+            # Fall back to the DB only for legacy tokens missing the role claim  
+            if not user_role:
+                user_role, user_id = AuthUtils.determine_user_role_and_id(user_email, db)
+
+                # Persist the patient row if the lookup had to create one  
+                db.commit()
 
             # Return extracted identity tuple  
             return user_email, user_role, user_id
@@ -2,25 +2,53 @@
 # For working with timestamps and timezones  
 from datetime import datetime, timedelta, timezone
 
-# For encoding and decoding JWTs and handling JWT-related exceptions  
-from jose import JWTError, jwt
+# For generating unique token IDs (jti claim)  
+import uuid
+
+# For guarding the shared payload cache across worker threads  
+import threading
+
+# For caching verified token payloads in-process with a bounded lifetime  
+from cachetools import TTLCache
+
+# For encoding and decoding JWTs (PyJWT, HMAC via OpenSSL) and handling JWT-related exceptions  
+import jwt
+from jwt import PyJWK, PyJWTError
+
+# For base64url-encoding the shared secret into a JWK  
+import base64
+
+# Fast JSON parsing of Google API responses  
+import orjson
+
+# For fixed-size digests of tokens used as cache keys  
+import hashlib
 
 # For database session handling using SQLAlchemy ORM  
 from sqlalchemy.orm import Session
 
-# For making HTTP requests (used for communicating with Google OAuth2 endpoints)  
-import requests
+# For composing a single cross-table lookup query  
+from sqlalchemy import func, insert, select, update, union_all, literal, or_
+
+# For running blocking DB work in a worker thread from async code  
+from fastapi.concurrency import run_in_threadpool
 
 # For raising HTTP exceptions in FastAPI  
 from fastapi import HTTPException
 
-# For printing error tracebacks in case of unexpected exceptions  
-import traceback
+# For server-side logging of unexpected auth failures  
+import logging
 
 # ---------------------------- Internal Imports ----------------------------
 # Application-wide settings from environment  
 from ..core.settings import settings
 
+# Shared async HTTP client for Google OAuth2 endpoints  
+from ..core.http_client import HttpClientManager
+
+# Revoked token IDs, populated on logout  
+from .token_revocation import TokenRevocationList
+
 # Import Admin model for DB queries  
 from ..models.admin_model import Admin
 
@@ -30,17 +58,58 @@ from ..models.doctor_model import Doctor
 # Import Patient model  
 from ..models.patient_model import Patient
 
+# ---------------------------- Logger ----------------------------
+# Module logger for unexpected token and OAuth errors  
+logger = logging.getLogger(__name__)
+
+# ---------------------------- Constants ----------------------------
+# Access token lifetime, computed once from settings  
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+# Signing key as bytes, encoded once instead of inside every encode call  
+_JWT_SECRET_BYTES = settings.JWT_SECRET.encode()
+
+# Verification key built once from the shared secret and bound to the configured algorithm  
+_JWT_VERIFY_KEY = PyJWK(
+    {"kty": "oct", "k": base64.urlsafe_b64encode(_JWT_SECRET_BYTES).rstrip(b"=").decode()},
+    algorithm=settings.JWT_ALGORITHM,
+)
+
+# Accepted signing algorithms, built once rather than per decode  
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+# Decoder with its options (exp and sub required) merged once at construction  
+_JWT_DECODER = jwt.PyJWT(options={"require": ["exp", "sub"]})
+
+# Upper bound on accepted token length; our tokens are a few hundred bytes  
+_JWT_MAX_LENGTH = 4096
+
+# Maps the JWT role claim to the table holding that user  
+ROLE_MODELS = {"admin": Admin, "doctor": Doctor, "patient": Patient}
+
 # ---------------------------- AuthUtils Class ----------------------------
 class AuthUtils:
     """
     A utility class for JWT operations and Google OAuth2 authentication.
     """
 
+    # Verified token payloads keyed by the token's SHA-256 digest, so repeat requests skip signature checks  
+    _payload_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+    # Lock for the payload cache, since verification also runs in threadpool workers  
+    _payload_cache_lock = threading.Lock()
+
+    # (role, id, email, name) rows keyed by (role, user_id), so /me polling skips the DB  
+    _identity_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+    # Lock for the identity cache, since lookups run in threadpool workers  
+    _identity_cache_lock = threading.Lock()
+
     # ------------------------ Method: Create JWT Token ------------------------
     @staticmethod
     def create_jwt_token(user_info: dict) -> str:
         """
-        Creates a JWT token with user's email, role, id, and expiry.
+        Creates a JWT token with user's email, role, id, expiry, and a unique token ID.
 
         Parameters:
         - user_info (dict): Dictionary containing email, role, and id.
@@ -49,7 +118,7 @@ class AuthUtils:
         - str: Encoded JWT token.
         """
         # Calculate token expiration time  
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + _ACCESS_TOKEN_TTL
 
         # Create the payload with user details  
         to_encode = {
@@ -57,10 +126,11 @@ class AuthUtils:
             "role": user_info["role"],
             "exp": expire,
             "id": user_info["id"],
+            "jti": uuid.uuid4().hex,
         }
 
         # Encode the payload using secret and algorithm  
-        encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, _JWT_SECRET_BYTES, algorithm=settings.JWT_ALGORITHM)
 
         # Return the encoded token  
         return encoded_jwt
@@ -70,6 +140,7 @@ class AuthUtils:
     def verify_jwt_token(token: str) -> dict:
         """
         Decodes and verifies the JWT token.
+        Payloads are cached per token for up to a minute and never past their expiry.
 
         Parameters:
         - token (str): JWT token to verify.
@@ -77,30 +148,180 @@ class AuthUtils:
         Returns:
         - dict: Decoded token payload.
         """
+        # Reject structurally impossible tokens (not three segments, or oversized) before hashing or crypto  
+        if not token or token.count(".") != 2 or len(token) > _JWT_MAX_LENGTH:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        # Serve a previously verified payload while the token is still unexpired  
+        cache_key = hashlib.sha256(token.encode()).digest()
+        with AuthUtils._payload_cache_lock:
+            cached = AuthUtils._payload_cache.get(cache_key)
+        if cached is not None and cached["exp"] > datetime.now(timezone.utc).timestamp():
+            # Reject tokens revoked by logout  
+            if TokenRevocationList.is_revoked(cached.get("jti")):
+                raise HTTPException(status_code=401, detail="Token has been revoked")
+            return cached
+
         try:
             # Attempt to decode the JWT token  
-            payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+            payload = _JWT_DECODER.decode(
+                token,
+                _JWT_VERIFY_KEY,
+                algorithms=_JWT_ALGORITHMS
+            )
 
             # Ensure 'id' is present in the payload  
             if "id" not in payload:
                 raise HTTPException(status_code=401, detail="Token does not contain user ID")
 
-            # Return decoded payload  
+            # Reject tokens revoked by logout  
+            if TokenRevocationList.is_revoked(payload.get("jti")):
+                raise HTTPException(status_code=401, detail="Token has been revoked")
+
+            # Cache and return decoded payload  
+            with AuthUtils._payload_cache_lock:
+                AuthUtils._payload_cache[cache_key] = payload
             return payload
 
-        except JWTError:
-            # Raise if token signature or structure is invalid  
+        except HTTPException:
+            # Propagate missing-ID and revoked-token errors as-is  
+            raise
+        except PyJWTError:
+            # Raise if token signature, structure, expiry, or required claims are invalid  
             raise HTTPException(status_code=401, detail="Invalid token")
         except Exception:
-            # Log unexpected decoding issues  
-            traceback.print_exc()
+            # Log unexpected decoding issues (never the token itself)  
+            logger.exception("Unexpected error while verifying JWT")
             raise HTTPException(status_code=500, detail="Token validation error")
 
+    # ------------------------ Method: Revoke JWT Token ------------------------
+    @staticmethod
+    def revoke_jwt_token(token: str) -> None:
+        """
+        Revokes a valid JWT token so it is rejected until it expires.
+
+        Parameters:
+        - token (str): JWT token to revoke.
+        """
+        # Verify first so only genuine tokens add entries to the revocation list  
+        payload = AuthUtils.verify_jwt_token(token)
+
+        # Tokens issued before jti was added cannot be revoked individually; keep the entry until the token expires  
+        jti = payload.get("jti")
+        if jti is not None:
+            TokenRevocationList.revoke(jti, payload["exp"])
+
+        # Drop the cached payload so the next check goes through revocation  
+        with AuthUtils._payload_cache_lock:
+            AuthUtils._payload_cache.pop(hashlib.sha256(token.encode()).digest(), None)
+
+    # ------------------------ Method: Find User Identity ------------------------
+    @staticmethod
+    def find_user_identity(db: Session, user_id: int | None, email: str | None):
+        """
+        Looks up a user across Admin, Doctor, and Patient tables in one UNION ALL query.
+
+        Parameters:
+        - db (Session): SQLAlchemy database session.
+        - user_id (int | None): User ID from the token (matched for Doctor/Patient).
+        - email (str | None): User email from the token (matched case-insensitively for all roles).
+
+        Returns:
+        - Row | None: (role, priority, id, email, name) of the first match in Admin → Doctor → Patient order.
+        """
+        # Compare emails case-insensitively, like _find_role_and_id and the lower(email) indexes  
+        email = email.lower() if email else email
+
+        # Tag each table's match with its role and a priority used to pick the winner  
+        stmt = union_all(
+            select(literal("admin").label("role"), literal(0).label("priority"), Admin.id, Admin.email, Admin.name)
+            .where(func.lower(Admin.email) == email),
+            select(literal("doctor"), literal(1), Doctor.id, Doctor.email, Doctor.name)
+            .where(or_(Doctor.id == user_id, func.lower(Doctor.email) == email)),
+            select(literal("patient"), literal(2), Patient.id, Patient.email, Patient.name)
+            .where(or_(Patient.id == user_id, func.lower(Patient.email) == email)),
+        ).order_by("priority").limit(1)
+
+        # Execute once and return the highest-priority match (or None)  
+        return db.execute(stmt).first()
+
+    # ------------------------ Method: Find User By Role ------------------------
+    @staticmethod
+    def find_user_by_role(db: Session, role: str, user_id: int):
+        """
+        Looks up a user by primary key in the single table named by the token's role claim.
+        Results are cached for a few minutes; writers call invalidate_user_identity.
+
+        Parameters:
+        - db (Session): SQLAlchemy database session.
+        - role (str): Role claim from the token ('admin' | 'doctor' | 'patient').
+        - user_id (int): User ID from the token.
+
+        Returns:
+        - Row | None: (role, id, email, name) of the user, or None if not found.
+        """
+        # Serve a recently looked-up identity without touching the DB  
+        key = (role, user_id)
+        with AuthUtils._identity_cache_lock:
+            cached = AuthUtils._identity_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Select only the profile columns from the role's table  
+        model = ROLE_MODELS[role]
+        stmt = select(literal(role).label("role"), model.id, model.email, model.name).where(model.id == user_id)
+
+        # Execute the single targeted query, caching hits (rows are immutable and session-independent)  
+        user = db.execute(stmt).first()
+        if user is not None:
+            with AuthUtils._identity_cache_lock:
+                AuthUtils._identity_cache[key] = user
+        return user
+
+    # ------------------------ Method: Invalidate User Identity ------------------------
+    @staticmethod
+    def invalidate_user_identity(role: str, user_id: int) -> None:
+        """
+        Drops a cached identity. Call after a user's name or email changes or the user is deleted.
+
+        Parameters:
+        - role (str): The user's role ('admin' | 'doctor' | 'patient').
+        - user_id (int): The user's ID.
+        """
+        with AuthUtils._identity_cache_lock:
+            AuthUtils._identity_cache.pop((role, user_id), None)
+
+    # ------------------------ Method: Find Role and ID ------------------------
+    @staticmethod
+    def _find_role_and_id(email: str, db: Session):
+        """
+        Looks an email up case-insensitively across Admin → Doctor → Patient without creating anything.
+
+        Parameters:
+        - email (str): The user's email address.
+        - db (Session): SQLAlchemy database session.
+
+        Returns:
+        - Row | None: Row with `role`, `id`, and the stored `email`, or None if no user has this email.
+        """
+        # Compare case-insensitively so the lower(email) indexes serve the lookup  
+        email = email.strip().lower()
+
+        # Look the email up in Admin → Doctor → Patient order with one UNION ALL round trip  
+        stmt = union_all(
+            select(literal("admin").label("role"), literal(0).label("priority"), Admin.id, Admin.email)
+            .where(func.lower(Admin.email) == email),
+            select(literal("doctor"), literal(1), Doctor.id, Doctor.email).where(func.lower(Doctor.email) == email),
+            select(literal("patient"), literal(2), Patient.id, Patient.email).where(func.lower(Patient.email) == email),
+        ).order_by("priority").limit(1)
+        return db.execute(stmt).first()
+
     # ------------------------ Method: Determine Role and ID ------------------------
     @staticmethod
     def determine_user_role_and_id(email: str, db: Session) -> tuple[str, int]:
         """
         Determines the user's role and ID based on email. Creates a Patient if not found.
+        A newly created Patient is not committed; the caller commits it with its own changes.
 
         Parameters:
         - email (str): The user's email address.
@@ -109,35 +330,84 @@ class AuthUtils:
         Returns:
         - tuple[str, int]: Role ('admin' | 'doctor' | 'patient'), and user ID.
         """
-        # Try finding the user in Admin table  
-        admin = db.query(Admin).filter(Admin.email == email).first()
-        if admin:
-            return "admin", admin.id
+        # Return the existing user's role and ID if the email is known  
+        match = AuthUtils._find_role_and_id(email, db)
+        if match:
+            return match.role, match.id
+
+        # If not found, create a new patient and read its ID back via RETURNING (no refresh round trip)  
+        patient_id = db.execute(
+            insert(Patient)
+            .values(name=email.split('@')[0], email=email)
+            .returning(Patient.id)
+        ).scalar_one()
 
-        # Try finding the user in Doctor table  
-        doctor = db.query(Doctor).filter(Doctor.email == email).first()
-        if doctor:
-            return "doctor", doctor.id
+        # Return default role and ID  
+        return "patient", patient_id
 
-        # Try finding the user in Patient table  
-        patient = db.query(Patient).filter(Patient.email == email).first()
+    # ------------------------ Method: Save Google Tokens ------------------------
+    @staticmethod
+    def save_google_tokens(
+        db: Session,
+        user_email: str,
+        user_name: str,
+        access_token: str,
+        refresh_token: str,
+        token_expiry: datetime
+    ) -> tuple[str, int, str]:
+        """
+        Resolves the user's role and stores their Google tokens on the matching record.
+        First-time users are created as patients with their tokens in a single INSERT.
 
-        # If not found, create a new patient  
-        if not patient:
-            patient = Patient(
-                name=email.split('@')[0],
-                email=email
-            )
-            db.add(patient)
+        Parameters:
+        - db (Session): SQLAlchemy database session.
+        - user_email (str): Email from the Google profile.
+        - user_name (str): Name from the Google profile.
+        - access_token (str): Google access token.
+        - refresh_token (str): Google refresh token.
+        - token_expiry (datetime): Access token expiry time.
+
+        Returns:
+        - tuple[str, int, str]: Role ('admin' | 'doctor' | 'patient'), user ID, and the email as stored
+          in the DB (which may differ in case from the Google profile email).
+        """
+        # -------- Determine user role and ID --------  
+        match = AuthUtils._find_role_and_id(user_email, db)
+
+        # -------- New user: insert the patient with its tokens in one statement --------  
+        if match is None:
+            patient_id = db.execute(
+                insert(Patient)
+                .values(
+                    name=user_name or user_email.split('@')[0],
+                    email=user_email,
+                    access_token=access_token,
+                    refresh_token=refresh_token,
+                    token_expiry=token_expiry
+                )
+                .returning(Patient.id)
+            ).scalar_one()
             db.commit()
-            db.refresh(patient)
+            return "patient", patient_id, user_email
 
-        # Return default role and ID  
-        return "patient", patient.id
+        # -------- Existing user: write tokens with one UPDATE, without loading the row --------  
+        role, user_id = match.role, match.id
+        model = ROLE_MODELS[role]
+        db.execute(
+            update(model)
+            .where(model.id == user_id)
+            .values(access_token=access_token, refresh_token=refresh_token, token_expiry=token_expiry)
+        )
+
+        # Commit all DB changes  
+        db.commit()
+
+        # Return the resolved role and ID with the stored email, so the JWT subject matches the DB row  
+        return role, user_id, match.email
 
     # ------------------------ Method: Google OAuth Authentication ------------------------
     @staticmethod
-    def authenticate_with_google(code: str, db: Session) -> dict:
+    async def authenticate_with_google(code: str, db: Session) -> dict:
         """
         Authenticates the user with Google and stores access/refresh tokens.
 
@@ -149,6 +419,9 @@ class AuthUtils:
         - dict: User info with email, name, role, and ID.
         """
         try:
+            # Shared async client, so TLS connections to Google are reused across logins  
+            client = HttpClientManager.get_client()
+
             # -------- Step 1: Exchange code for access/refresh tokens --------  
             token_data = {
                 "code": code,
@@ -159,9 +432,9 @@ class AuthUtils:
             }
 
             # Send request to Google's token endpoint  
-            response = requests.post("https://oauth2.googleapis.com/token", data=token_data)
+            response = await client.post("https://oauth2.googleapis.com/token", data=token_data)
             response.raise_for_status()
-            token_info = response.json()
+            token_info = orjson.loads(response.content)
 
             # Check token response for required fields  
             if not all(k in token_info for k in ["access_token", "refresh_token", "expires_in"]):
@@ -173,62 +446,41 @@ class AuthUtils:
             expires_in = token_info["expires_in"]
             token_expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
 
-            # -------- Step 2: Fetch user's Google profile info --------  
-            user_info_response = requests.get(
-                "https://www.googleapis.com/oauth2/v3/userinfo",
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            user_info_response.raise_for_status()
-            user_info = user_info_response.json()
+            # -------- Step 2: Get user's Google profile info --------  
+            # With the openid scope, the id_token already carries email and name. It came straight from
+            # Google's token endpoint over TLS, so its claims can be read without a second round trip  
+            user_info = {}
+            if "id_token" in token_info:
+                user_info = jwt.decode(token_info["id_token"], options={"verify_signature": False})
+
+            # Fall back to the userinfo endpoint when there is no id_token or it lacks the email  
+            if not user_info.get("email"):
+                user_info_response = await client.get(
+                    "https://www.googleapis.com/oauth2/v3/userinfo",
+                    headers={"Authorization": f"Bearer {access_token}"}
+                )
+                user_info_response.raise_for_status()
+                user_info = orjson.loads(user_info_response.content)
 
             # Extract user name and email  
             user_name = user_info.get("name", "")
             user_email = user_info.get("email", "")
 
-            # -------- Step 3: Determine user role and ID --------  
-            role, user_id = AuthUtils.determine_user_role_and_id(user_email, db)
-
-            # -------- Step 4: Save tokens to the appropriate model --------  
-            if role == "admin":
-                admin = db.query(Admin).filter(Admin.id == user_id).first()
-                admin.access_token = access_token
-                admin.refresh_token = refresh_token
-                admin.token_expiry = token_expiry
-
-            elif role == "doctor":
-                doctor = db.query(Doctor).filter(Doctor.id == user_id).first()
-                doctor.access_token = access_token
-                doctor.refresh_token = refresh_token
-                doctor.token_expiry = token_expiry
-
-            elif role == "patient":
-                patient = db.query(Patient).filter(Patient.id == user_id).first()
-                if not patient:
-                    patient = Patient(
-                        name=user_name,
-                        email=user_email,
-                        access_token=access_token,
-                        refresh_token=refresh_token,
-                        token_expiry=token_expiry
-                    )
-                    db.add(patient)
-                else:
-                    patient.access_token = access_token
-                    patient.refresh_token = refresh_token
-                    patient.token_expiry = token_expiry
-
-            # Commit all DB changes  
-            db.commit()
+            # -------- Step 3: Determine role and save tokens (blocking DB work, off the event loop) --------  
+            role, user_id, stored_email = await run_in_threadpool(
+                AuthUtils.save_google_tokens,
+                db, user_email, user_name, access_token, refresh_token, token_expiry
+            )
 
-            # -------- Step 5: Return user profile --------  
+            # -------- Step 4: Return user profile (stored email, so the JWT subject matches the DB row) --------  
             return {
-                "email": user_email,
+                "email": stored_email,
                 "name": user_name,
                 "role": role,
                 "id": user_id
             }
 
         except Exception as e:
-            # Print full traceback for internal logs  
-            traceback.print_exc()
+            # Log the full traceback server-side  
+            logger.exception("Google authentication failed")
             raise Exception(f"Error during Google authentication: {str(e)}")
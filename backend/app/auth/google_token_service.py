@@ -1,6 +1,9 @@
 # ------------------------------------- External Imports -------------------------------------
-# To make asynchronous HTTP requests to Google APIs  
-import httpx  
+# To share one in-flight refresh between overlapping requests  
+import asyncio  
+
+# For lazily formatted diagnostic logging  
+import logging  
 
 # For working with datetime objects and time comparisons (with timezone support)  
 from datetime import datetime, timedelta, timezone  
@@ -8,21 +11,80 @@ from datetime import datetime, timedelta, timezone
 # For handling HTTP exceptions in FastAPI  
 from fastapi import HTTPException  
 
+# For running blocking DB calls in a worker thread so the event loop stays free  
+from fastapi.concurrency import run_in_threadpool  
+
+# For remembering recently seen tokens with a bounded lifetime  
+from cachetools import TTLCache  
+
+# Fast JSON parsing of Google token responses  
+import orjson  
+
 # ------------------------------------- Internal Imports -------------------------------------
 # Application-wide settings from environment  
 from ..core.settings import settings  
 
+# Shared async HTTP client for Google OAuth2 endpoints  
+from ..core.http_client import HttpClientManager  
+
 # Import models to access token data directly from respective tables  
 from ..models.admin_model import Admin  
 from ..models.doctor_model import Doctor  
 from ..models.patient_model import Patient  
 
+# Doctor list service, whose cached pages include doctors' Google tokens  
+from ..services.doctor.get_all_doctors_service import GetAllDoctorsService  
+
+# ------------------------------------- Logger -------------------------------------
+# Module logger for token refresh diagnostics  
+logger = logging.getLogger(__name__)  
+
 # ------------------------------------- Class: GoogleTokenManager -------------------------------------
 class GoogleTokenService:
     """
     Handles Google OAuth2 token refresh and access token retrieval based on user role.
     """
 
+    # In-flight refreshes keyed by (role, user_id) so concurrent callers share one Google call  
+    _inflight_refreshes: dict[tuple[str, int], asyncio.Future] = {}
+
+    # Recently seen (access_token, refresh_token, expiry) keyed by (role, user_id), to skip the DB read for fresh tokens  
+    _token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=600)
+
+    # Tokens with more than this much lifetime left are served straight from the cache  
+    _FRESH_MARGIN = timedelta(minutes=5)
+
+    # Tokens with less than this much lifetime left are refreshed from Google  
+    _REFRESH_MARGIN = timedelta(minutes=2)
+
+    # ------------------------ Method: Needs Refresh ------------------------
+    @staticmethod
+    def needs_refresh(user_id: int, role: str) -> bool:
+        """
+        Check, without touching the DB, whether the user's Google token may need a refresh.
+
+        Parameters:
+        - user_id (int): User ID from the database
+        - role (str): User role (admin/doctor/patient)
+
+        Returns:
+        - bool: False only when a cached token is known to have plenty of lifetime left
+        """
+        cached = GoogleTokenService._token_cache.get((role, user_id))
+        return cached is None or cached[2] <= datetime.now(timezone.utc) + GoogleTokenService._FRESH_MARGIN
+
+    # ------------------------ Method: Invalidate Cached Token ------------------------
+    @staticmethod
+    def invalidate_cached_token(role: str, user_id: int) -> None:
+        """
+        Drop a user's cached Google tokens. Call after their tokens are written or the user is deleted.
+
+        Parameters:
+        - role (str): User role (admin/doctor/patient)
+        - user_id (int): User ID from the database
+        """
+        GoogleTokenService._token_cache.pop((role, user_id), None)
+
     # ------------------------ Method: Get Valid Access Token ------------------------
     @staticmethod
     async def get_valid_google_access_token(user_id: int, role: str, db):
@@ -38,19 +100,28 @@ class GoogleTokenService:
         Returns:
         - tuple[str, str]: (access_token, refresh_token)
         """
-        # Determine the user object based on role  
+        # Serve a recently seen token that still has plenty of lifetime left  
+        key = (role, user_id)
+        if not GoogleTokenService.needs_refresh(user_id, role):
+            access_token, refresh_token, _ = GoogleTokenService._token_cache[key]
+            return access_token, refresh_token
+
+        # Determine the user model based on role  
         if role == "admin":
-            user = db.query(Admin).filter(Admin.id == user_id).first()
+            model = Admin
         elif role == "doctor":
-            user = db.query(Doctor).filter(Doctor.id == user_id).first()
+            model = Doctor
         elif role == "patient":
-            user = db.query(Patient).filter(Patient.id == user_id).first()
+            model = Patient
         else:
             raise HTTPException(status_code=400, detail="Invalid user role.")
 
+        # Load the user record off the event loop  
+        user = await run_in_threadpool(db.get, model, user_id)
+
         # If user record not found  
         if not user:
-            print("No user found for provided ID and role.")
+            logger.debug("No %s found with ID %s", role, user_id)
             raise HTTPException(status_code=404, detail="User not found.")
 
         # Extract token expiry field  
@@ -61,9 +132,14 @@ class GoogleTokenService:
             token_expiry = datetime.fromisoformat(token_expiry)
 
         # If token is missing or about to expire, refresh it  
-        if not token_expiry or token_expiry <= datetime.now(timezone.utc) + timedelta(minutes=2):
-            # Use the refresh token to get a new access token  
-            new_token_data = await GoogleTokenService.refresh_google_access_token(user.refresh_token)
+        if not token_expiry or token_expiry <= datetime.now(timezone.utc) + GoogleTokenService._REFRESH_MARGIN:
+            # Use the refresh token to get a new access token, joining any refresh already in flight  
+            refresh = GoogleTokenService._inflight_refreshes.get(key)
+            if refresh is None:
+                refresh = asyncio.ensure_future(GoogleTokenService.refresh_google_access_token(user.refresh_token))
+                GoogleTokenService._inflight_refreshes[key] = refresh
+                refresh.add_done_callback(lambda _: GoogleTokenService._inflight_refreshes.pop(key, None))
+            new_token_data = await asyncio.shield(refresh)
 
             # If response lacks access token, raise an error  
             if not new_token_data.get("access_token"):
@@ -71,14 +147,22 @@ class GoogleTokenService:
 
             # Update access token and token expiry  
             user.access_token = new_token_data["access_token"]
-            user.token_expiry = datetime.now(timezone.utc) + timedelta(seconds=new_token_data["expires_in"])
+            token_expiry = datetime.now(timezone.utc) + timedelta(seconds=new_token_data["expires_in"])
+            user.token_expiry = token_expiry
 
             # If refresh token was rotated, update it  
             if "refresh_token" in new_token_data:
                 user.refresh_token = new_token_data["refresh_token"]
 
-            # Commit changes to DB  
-            db.commit()
+            # Commit changes to DB off the event loop  
+            await run_in_threadpool(db.commit)
+
+            # Cached doctor list pages carry the old tokens, so drop them  
+            if role == "doctor":
+                GetAllDoctorsService.invalidate_cache()
+
+        # Remember the valid tokens so later calls can skip the DB read  
+        GoogleTokenService._token_cache[key] = (user.access_token, user.refresh_token, token_expiry)
 
         # Return valid access and refresh tokens  
         return user.access_token, user.refresh_token
@@ -106,13 +190,12 @@ class GoogleTokenService:
             "grant_type": "refresh_token",
         }
 
-        # Make async POST request  
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, data=payload)
+        # Make async POST request over the shared, pooled client  
+        response = await HttpClientManager.get_client().post(token_url, data=payload)
 
         # Raise error if request failed  
         if response.status_code != 200:
             raise HTTPException(status_code=400, detail="Failed to refresh token from Google.")
 
         # Return the parsed token response  
-        return response.json()
+        return orjson.loads(response.content)
@@ -0,0 +1,73 @@
+# ------------------------------------- External Imports -------------------------------------
+# For guarding the revocation set across worker threads
+import threading
+
+# For expiry timestamps of revoked tokens
+import time
+
+# ------------------------------------- Internal Imports -------------------------------------
+# Application-wide settings from environment
+from ..core.settings import settings
+
+# ------------------------------------- Class: TokenRevocationList -------------------------------------
+class TokenRevocationList:
+    """
+    Tracks revoked JWT IDs (jti) so logged-out tokens are rejected before their natural expiry.
+    Entries are kept until their token expires and are never evicted early, so a revocation
+    cannot be silently undone under heavy logout volume; expired entries are purged lazily.
+    """
+
+    # Revoked token IDs mapped to the Unix time at which their token expires
+    _revoked: dict[str, float] = {}
+
+    # Lock for the revocation set, since token checks also run in threadpool workers
+    _lock = threading.Lock()
+
+    # Earliest Unix time at which the next purge of expired entries may run
+    _next_purge: float = 0.0
+
+    # Minimum number of seconds between purges, so revoking stays cheap
+    _PURGE_INTERVAL = 60.0
+
+    # ------------------------ Method: Revoke ------------------------
+    @staticmethod
+    def revoke(jti: str, expires_at: float | None = None) -> None:
+        """
+        Marks a token ID as revoked until its token expires.
+
+        Parameters:
+        - jti (str): The token's unique ID claim.
+        - expires_at (float | None): The token's exp claim as a Unix time
+          (defaults to the full access token lifetime from now).
+        """
+        now = time.time()
+        if expires_at is None:
+            expires_at = now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+        with TokenRevocationList._lock:
+            TokenRevocationList._revoked[jti] = expires_at
+
+            # Drop entries whose tokens have expired, at most once per purge interval
+            if now >= TokenRevocationList._next_purge:
+                TokenRevocationList._revoked = {
+                    k: exp for k, exp in TokenRevocationList._revoked.items() if exp > now
+                }
+                TokenRevocationList._next_purge = now + TokenRevocationList._PURGE_INTERVAL
+
+    # ------------------------ Method: Is Revoked ------------------------
+    @staticmethod
+    def is_revoked(jti: str | None) -> bool:
+        """
+        Checks whether a token ID has been revoked.
+
+        Parameters:
+        - jti (str | None): The token's unique ID claim (None for legacy tokens).
+
+        Returns:
+        - bool: True if the token was revoked and has not yet expired.
+        """
+        if jti is None:
+            return False
+        with TokenRevocationList._lock:
+            expires_at = TokenRevocationList._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
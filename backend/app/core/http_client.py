@@ -0,0 +1,38 @@
+# ---------------------------- External Imports ----------------------------
+# Import httpx for asynchronous HTTP requests with connection pooling
+import httpx
+
+# ---------------------------- Constants ----------------------------
+# Connection pool bounds for the shared client; idle keep-alive sockets are kept for reuse
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# ---------------------------- Class: HttpClientManager ----------------------------
+class HttpClientManager:
+    """
+    Holds a single shared httpx.AsyncClient for outbound calls (e.g., Google OAuth2),
+    so TLS connections are reused across requests instead of re-established per call.
+    """
+
+    # Shared client instance, created on first use
+    _client: httpx.AsyncClient | None = None
+
+    # ------------------------ Method: Get Client ------------------------
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """
+        Returns the shared async HTTP client, creating it if needed.
+        """
+        # Lazily create the client so non-app entry points (e.g., MCP tools) can use it too
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(limits=_CLIENT_LIMITS, timeout=10.0)
+        return cls._client
+
+    # ------------------------ Method: Close Client ------------------------
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Closes the shared client and its pooled connections. Call on app shutdown.
+        """
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
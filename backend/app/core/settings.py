@@ -11,6 +11,12 @@ class Settings(BaseSettings):
     # PostgreSQL Database URL, typically includes user, password, host, port, and DB name
     DATABASE_URL: str = Field(..., env="DATABASE_URL")
 
+    # Persistent connections kept in the SQLAlchemy pool (tune to worker concurrency)
+    SQLALCHEMY_POOL_SIZE: int = Field(20, env="SQLALCHEMY_POOL_SIZE")
+
+    # Extra connections the SQLAlchemy pool may open during bursts
+    SQLALCHEMY_MAX_OVERFLOW: int = Field(40, env="SQLALCHEMY_MAX_OVERFLOW")
+
     # JWT secret key used for signing access and refresh tokens
     JWT_SECRET: str = Field(..., env="JWT_SECRET")
 
@@ -24,8 +24,16 @@ class DatabaseSessionManager:
         # Store the DB name for logging/debugging purposes
         self.db_name = db_url.split("/")[-1]
 
-        # Create the SQLAlchemy engine instance for managing DB connections
-        self.engine = create_engine(db_url)
+        # Create the SQLAlchemy engine instance with a pool sized for concurrent requests
+        self.engine = create_engine(
+            db_url,
+            pool_size=settings.SQLALCHEMY_POOL_SIZE,        # Persistent connections kept open in the pool
+            max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,  # Extra connections allowed during login/poll bursts
+            pool_timeout=10,                                # Seconds to wait for a free connection before failing fast
+            pool_pre_ping=True,                             # Validate connections before use to drop stale ones
+            pool_recycle=1800,                              # Recycle connections every 30 minutes to avoid server-side timeouts
+            pool_use_lifo=True                              # Reuse the most recent connection so idle extras can age out
+        )
 
         # Create a sessionmaker factory bound to the DB engine
         self.SessionLocal = sessionmaker(
@@ -51,3 +59,7 @@ class DatabaseSessionManager:
         finally:
             # Close the session after the request completes
             db.close()
+
+# ---------------------------- Shared Instance ----------------------------
+# Single manager (engine and connection pool) shared by all routes and background tasks
+db_manager = DatabaseSessionManager()
@@ -61,7 +61,7 @@ class GmailService:
 
         # ----------------- Step 1: Fetch appointment -----------------
         # Query the appointment by ID from the database
-        appointment = self.db.query(Appointment).filter(Appointment.id == appointment_id).first()
+        appointment = self.db.get(Appointment, appointment_id)
 
         # Raise error if appointment is not found
         if not appointment:
@@ -69,10 +69,10 @@ class GmailService:
 
         # ----------------- Step 2: Fetch doctor and patient -----------------
         # Fetch doctor associated with the appointment
-        doctor = self.db.query(Doctor).filter(Doctor.id == appointment.doctor_id).first()
+        doctor = self.db.get(Doctor, appointment.doctor_id)
 
         # Fetch patient associated with the appointment
-        patient = self.db.query(Patient).filter(Patient.id == appointment.patient_id).first()
+        patient = self.db.get(Patient, appointment.patient_id)
 
         # Raise error if either doctor or patient is missing
         if not doctor or not patient:
@@ -18,6 +18,9 @@ from .mcp_main import mcp
 # Import centralized settings for environment variables
 from .core.settings import settings
 
+# Import the shared outbound HTTP client so it can be closed on shutdown
+from .core.http_client import HttpClientManager
+
 # Import authentication route handlers
 from .auth.auth_routes import router as auth_router
 
@@ -37,7 +40,7 @@ from .api.doctor_slot_routes import router as doctor_slot_router
 # Define FastAPI lifespan context to manage startup/shutdown events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """FastAPI lifespan context to run MCP asynchronously on startup."""
+    """FastAPI lifespan context to run MCP asynchronously on startup and release shared clients on shutdown."""
 
     # Parse host and port from MCP_URL setting (format: http://host:port)
     host_port = settings.MCP_URL.split("//")[1].split(":")
@@ -51,6 +54,9 @@ async def lifespan(app: FastAPI):
     # Yield control to FastAPI; app continues running while inside this block
     yield
 
+    # Close pooled outbound HTTP connections on shutdown
+    await HttpClientManager.aclose()
+
 # ---------------------------- App Initialization ----------------------------
 # Create FastAPI app instance with lifespan context
 app = FastAPI(lifespan=lifespan)
@@ -62,6 +68,7 @@ app.add_middleware(
     allow_credentials=True,                           # Allow cookies and credentials
     allow_methods=["*"],                              # Allow all HTTP methods
     allow_headers=["*"],                              # Allow all headers
+    expose_headers=["X-Next-After"],                  # Let the frontend read list pagination cursors
 )
 
 # ---------------------------- Router Registration ----------------------------
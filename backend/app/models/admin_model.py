@@ -1,6 +1,6 @@
 # ------------------------------------- External Imports -------------------------------------
-# For defining column schema and types  
-from sqlalchemy import Column, Integer, String
+# For defining column schema, types, and indexes  
+from sqlalchemy import Column, Index, Integer, String, func, text
 
 # ------------------------------------- Internal Imports -------------------------------------
 # For accessing the declarative base for SQLAlchemy models  
@@ -18,14 +18,20 @@ class Admin(Base):
     # Specify the table name for this model in the database  
     __tablename__ = 'admins'
 
+    # Unique lower(email) index: serves the case-insensitive email lookups (carrying id for index-only
+    # role resolution) and blocks case-only duplicates, so no separate exact-email index is kept
+    __table_args__ = (
+        Index("ix_admins_email_lower", func.lower(text("email")), unique=True, postgresql_include=["id"]),
+    )
+
     # Unique identifier for each admin (Primary Key, auto-incremented)  
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Name of the admin (cannot be null)  
     name = Column(String, nullable=False)
 
-    # Email of the admin (must be unique and non-null)  
-    email = Column(String, unique=True, nullable=False)
+    # Email of the admin (non-null; unique and indexed via the lower(email) index above)  
+    email = Column(String, nullable=False)
 
     # ---------------- Google OAuth Token Fields ----------------
     # Access token to allow admin to interact with Google APIs (e.g., Gmail, Calendar)  
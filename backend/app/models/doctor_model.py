@@ -1,6 +1,6 @@
 # ------------------------------------- External Imports -------------------------------------
-# Required SQLAlchemy column types for table definitions
-from sqlalchemy import Column, Integer, String, JSON
+# Required SQLAlchemy column types and index construct for table definitions
+from sqlalchemy import Column, Index, Integer, String, JSON, func, text
 
 # ------------------------------------- Internal Imports -------------------------------------
 # Import base ORM model for table inheritance
@@ -17,14 +17,20 @@ class Doctor(Base):
     # Name of the table in the database
     __tablename__ = 'doctors'
 
+    # Unique lower(email) index: serves the case-insensitive email lookups (carrying id for index-only
+    # role resolution) and blocks case-only duplicates, so no separate exact-email index is kept
+    __table_args__ = (
+        Index("ix_doctors_email_lower", func.lower(text("email")), unique=True, postgresql_include=["id"]),
+    )
+
     # Primary key: unique ID for each doctor (auto-incremented)
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Full name of the doctor (required field)
     name = Column(String, nullable=False)
 
-    # Unique email address for the doctor (used for login and identification)
-    email = Column(String, unique=True, nullable=False)
+    # Email address for the doctor, used for login and identification (unique and indexed via the lower(email) index above)
+    email = Column(String, nullable=False)
 
     # Optional phone number for the doctor
     phone_number = Column(String, nullable=True)
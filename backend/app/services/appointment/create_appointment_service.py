@@ -8,8 +8,8 @@ import calendar
 # Time utility from datetime to create time objects
 from datetime import time
 
-# Built-in traceback module for debugging exceptions
-import traceback
+# Standard logging for unexpected booking failures
+import logging
 
 # SQLAlchemy ORM Session for DB interactions
 from sqlalchemy.orm import Session
@@ -38,6 +38,14 @@ from ...google_integration.google_calender_service import GoogleCalendarService
 # Slot filter utility to exclude already booked slots
 from ...utils.slot_availability_utils import SlotAvailabilityUtils
 
+# ---------------------------- Logger ----------------------------
+# Module logger for appointment creation errors
+logger = logging.getLogger(__name__)
+
+# ---------------------------- Constants ----------------------------
+# Roles allowed to book appointments
+_BOOKING_ROLES: frozenset[str] = frozenset(("admin", "patient"))
+
 # ---------------------------- Class: AppointmentService ----------------------------
 class CreateAppointmentService:
     """
@@ -68,11 +76,11 @@ class CreateAppointmentService:
             _, user_role, _ = AuthUserCheck.get_user_from_token(token, self.db)
 
             # Enforce that only patients or admins can book appointments
-            if user_role not in ["admin", "patient"]:
+            if user_role not in _BOOKING_ROLES:
                 raise HTTPException(status_code=403, detail="Only admin or patient can create an appointment")
 
             # Query the doctor from the DB using the given doctor_id
-            doctor = self.db.query(Doctor).filter(Doctor.id == appointment.doctor_id).first()
+            doctor = self.db.get(Doctor, appointment.doctor_id)
 
             # Raise 404 if doctor is not found
             if not doctor:
@@ -138,10 +146,10 @@ class CreateAppointmentService:
             self.db.refresh(new_appointment)
 
             # Fetch the patient object to send confirmation and calendar invite
-            patient = self.db.query(Patient).filter(Patient.id == new_appointment.patient_id).first()
+            patient = self.db.get(Patient, new_appointment.patient_id)
 
             # Get admin (usually sender of emails & owner of calendar events)
-            admin = self.db.query(Admin).filter(Admin.id == 1).first()
+            admin = self.db.get(Admin, 1)
 
             # Send confirmation email to the patient
             await GmailService(db=self.db, user_id=admin.id).send_email_via_gmail(
@@ -171,7 +179,7 @@ class CreateAppointmentService:
         except HTTPException as http_exc:
             raise http_exc
 
-        # Catch any unexpected exception, print traceback, and raise 500
+        # Catch any unexpected exception, log it with its traceback, and raise 500
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("Failed to create appointment")
             raise HTTPException(status_code=500, detail=str(e))
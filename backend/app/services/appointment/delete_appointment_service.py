@@ -55,17 +55,17 @@ class DeleteAppointmentService:
             raise HTTPException(status_code=403, detail="Only admin can delete appointments")
 
         # Fetch the appointment by its ID
-        appointment = self.db.query(Appointment).filter(Appointment.id == appointment_id).first()
+        appointment = self.db.get(Appointment, appointment_id)
 
         # Raise 404 if appointment doesn't exist
         if not appointment:
             raise HTTPException(status_code=404, detail="Appointment not found")
 
         # Fetch the patient associated with this appointment
-        patient = self.db.query(Patient).filter(Patient.id == appointment.patient_id).first()
+        patient = self.db.get(Patient, appointment.patient_id)
 
         # Retrieve the default admin user (used as sender for notifications)
-        admin = self.db.query(Admin).filter(Admin.id == 1).first()
+        admin = self.db.get(Admin, 1)
 
         # If event ID is present, remove it from Google Calendar
         if appointment.event_id:
@@ -43,7 +43,7 @@ class GetAppointmentByIDService:
         _, user_role, user_id = AuthUserCheck.get_user_from_token(token, self.db)
 
         # Query the appointment by its ID
-        appointment = self.db.query(Appointment).filter(Appointment.id == appointment_id).first()
+        appointment = self.db.get(Appointment, appointment_id)
 
         # Raise 404 if the appointment does not exist
         if not appointment:
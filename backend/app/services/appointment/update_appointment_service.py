@@ -74,7 +74,7 @@ class UpdateAppointmentService:
                 raise HTTPException(status_code=403, detail="Only admin can update appointments")
 
             # Fetch the existing appointment
-            appointment = self.db.query(Appointment).filter(Appointment.id == appointment_id).first()
+            appointment = self.db.get(Appointment, appointment_id)
             if not appointment:
                 raise HTTPException(status_code=404, detail="Appointment not found")
 
@@ -84,7 +84,7 @@ class UpdateAppointmentService:
             start_time = appointment_update.start_time or appointment.start_time
 
             # Retrieve doctor's schedule and availability
-            doctor = self.db.query(Doctor).filter(Doctor.id == doctor_id).first()
+            doctor = self.db.get(Doctor, doctor_id)
             weekday_key = calendar.day_name[date.weekday()].lower()[:3]
             available_days = doctor.available_days or {}
 
@@ -132,8 +132,8 @@ class UpdateAppointmentService:
             self.db.refresh(appointment)
 
             # Fetch related patient and admin info for notifications
-            patient = self.db.query(Patient).filter(Patient.id == appointment.patient_id).first()
-            admin = self.db.query(Admin).filter(Admin.id == 1).first()
+            patient = self.db.get(Patient, appointment.patient_id)
+            admin = self.db.get(Admin, 1)
 
             # Update the calendar event if it exists
             if appointment.event_id:
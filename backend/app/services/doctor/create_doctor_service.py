@@ -5,6 +5,9 @@ from fastapi import HTTPException
 # Import Session type from SQLAlchemy
 from sqlalchemy.orm import Session
 
+# Import SQLAlchemy constructs for a lightweight existence check
+from sqlalchemy import select, exists, func
+
 # ---------------------------- Internal Imports ----------------------------
 # Import Doctor ORM model
 from ...models.doctor_model import Doctor
@@ -18,6 +21,9 @@ from ...auth.auth_user_check import AuthUserCheck
 # Slot generation utility to compute weekly slots from available_days
 from ...utils.slot_availability_utils import SlotAvailabilityUtils
 
+# Import the doctor list service to invalidate its cache after writes
+from .get_all_doctors_service import GetAllDoctorsService
+
 # ---------------------------- Class: CreateDoctorService ----------------------------
 class CreateDoctorService:
     """
@@ -53,6 +59,11 @@ class CreateDoctorService:
             if role != "admin":
                 raise HTTPException(status_code=403, detail="Admin access required")
 
+            # Check case-insensitively, matching the lower(email) unique index
+            exists_stmt = select(exists().where(func.lower(Doctor.email) == doctor.email.lower()))
+            if self.db.scalar(exists_stmt):
+                raise HTTPException(status_code=400, detail="Doctor already exists")
+
             # Create new Doctor object from Pydantic schema
             new_doctor = Doctor(**doctor.model_dump())
 
@@ -67,6 +78,9 @@ class CreateDoctorService:
             self.db.commit()
             self.db.refresh(new_doctor)
 
+            # Invalidate the cached doctor list so readers see the change
+            GetAllDoctorsService.invalidate_cache()
+
             # Return the created doctor
             return new_doctor
 
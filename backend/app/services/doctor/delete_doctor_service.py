@@ -15,6 +15,15 @@ from ...schemas.doctor_schema import DoctorDeleteResponse
 # Import the helper function to decode JWT and extract user role
 from ...auth.auth_user_check import AuthUserCheck
 
+# Import auth utilities to invalidate the cached /me identity after writes
+from ...auth.auth_utils import AuthUtils
+
+# Import the Google token service to drop cached tokens after writes
+from ...auth.google_token_service import GoogleTokenService
+
+# Import the doctor list service to invalidate its cache after writes
+from .get_all_doctors_service import GetAllDoctorsService
+
 # ---------------------------- Class: DeleteDoctorService ----------------------------
 class DeleteDoctorService:
     """
@@ -51,7 +60,7 @@ class DeleteDoctorService:
                 raise HTTPException(status_code=403, detail="Admin access required")
 
             # Fetch the doctor from the DB by ID
-            doctor = self.db.query(Doctor).filter(Doctor.id == doctor_id).first()
+            doctor = self.db.get(Doctor, doctor_id)
 
             # Raise 404 if doctor doesn't exist
             if not doctor:
@@ -61,6 +70,11 @@ class DeleteDoctorService:
             self.db.delete(doctor)
             self.db.commit()
 
+            # Invalidate the cached doctor list, /me identity, and Google tokens so readers see the change
+            GetAllDoctorsService.invalidate_cache()
+            AuthUtils.invalidate_user_identity("doctor", doctor_id)
+            GoogleTokenService.invalidate_cached_token("doctor", doctor_id)
+
             # Return a success response with doctor ID
             return DoctorDeleteResponse(
                 message="Doctor deleted successfully",
@@ -2,16 +2,37 @@
 # FastAPI HTTPException for proper error responses
 from fastapi import HTTPException
 
-# SQLAlchemy session class for DB operations
-from sqlalchemy.orm import Session
+# Run blocking DB calls in a worker thread so the event loop stays free
+from fastapi.concurrency import run_in_threadpool
+
+# SQLAlchemy select construct and session class for DB operations
+from sqlalchemy import select
+from sqlalchemy.orm import Session, raiseload
+
+# In-process TTL cache for the rarely changing full doctor list
+from cachetools import TTLCache
 
 # ---------------------------- Internal Imports ----------------------------
 # Import the Doctor model for querying doctor data
 from ...models.doctor_model import Doctor
 
+# Import the read schema used to snapshot cached doctor rows
+from ...schemas.doctor_schema import DoctorRead
+
 # Import the JWT helper to extract role and user ID
 from ...auth.auth_user_check import AuthUserCheck
 
+# Import the shared service error-handling decorator
+from ...utils.service_errors import wrap_service_errors
+
+# ---------------------------- Constants ----------------------------
+# Roles allowed to view the full doctor list
+_VIEW_ALL_ROLES: frozenset[str] = frozenset(("admin", "patient"))
+
+# ---------------------------- Statements ----------------------------
+# Base doctor list statement, built once so every request reuses the same construct
+_DOCTOR_PAGE_STMT = select(Doctor).options(raiseload("*")).order_by(Doctor.id)
+
 # ---------------------------- Class: GetAllDoctorsService ----------------------------
 class GetAllDoctorsService:
     """
@@ -20,45 +41,71 @@ class GetAllDoctorsService:
     - Doctors see only their own record.
     """
 
+    # Doctor list pages shared by admins and patients, keyed by (after_id, limit) and cached for 60 seconds
+    _doctor_list_cache: TTLCache = TTLCache(maxsize=64, ttl=60)
+
+    # ---------------------------- Method: invalidate_cache ----------------------------
+    @staticmethod
+    def invalidate_cache() -> None:
+        """
+        Drop all cached doctor list pages. Call after any doctor is created, updated, or deleted.
+        """
+        GetAllDoctorsService._doctor_list_cache.clear()
+
     # ---------------------------- Constructor ----------------------------
     def __init__(self, db: Session):
         # Store the DB session instance
         self.db = db
 
     # ---------------------------- Method: get_all_doctors ----------------------------
-    async def get_all_doctors(self, token: str) -> list[Doctor]:
+    @wrap_service_errors
+    async def get_all_doctors(
+        self,
+        token: str,
+        after_id: int | None = None,
+        limit: int = 50
+    ) -> tuple[list[Doctor] | list[DoctorRead], int | None]:
         """
-        Get a list of doctors based on user's role.
+        Get a page of doctors based on user's role, using keyset pagination on ID.
 
         Args:
             token (str): JWT token to identify user
+            after_id (int | None): Return only doctors with an ID greater than this cursor
+            limit (int): Maximum number of doctors to return
 
         Returns:
-            list[Doctor]: List of doctor records
+            tuple: Doctor records (cached snapshots for admins and patients) and the
+                   cursor for the next page, or None when this is the last page
         """
-        try:
-            # Decode the token and extract user role and ID
-            _, role, user_id = AuthUserCheck.get_user_from_token(token, self.db)
-
-            # Admins and patients can view all doctors
-            if role in ("admin", "patient"):
-                return self.db.query(Doctor).all()
-
-            # Doctors can only view themselves
-            elif role == "doctor":
-                doctor = self.db.query(Doctor).filter(Doctor.id == user_id).first()
-                if not doctor:
-                    raise HTTPException(status_code=404, detail="Doctor not found")
-                return [doctor]
-
-            # If role is invalid or unauthorized
-            else:
-                raise HTTPException(status_code=403, detail="Unauthorized role")
-
-        # Reraise known HTTP exceptions without masking
-        except HTTPException:
-            raise
-
-        # Catch unexpected errors and return a 500 error
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        # Decode the token and extract user role and ID
+        _, role, user_id = await run_in_threadpool(AuthUserCheck.get_user_from_token, token, self.db)
+
+        # Admins and patients can view all doctors
+        if role in _VIEW_ALL_ROLES:
+            # Serve from cache when warm; snapshot rows as schemas so they outlive this session
+            cache_key = (after_id, limit)
+            try:
+                return GetAllDoctorsService._doctor_list_cache[cache_key]
+            except KeyError:
+                stmt = _DOCTOR_PAGE_STMT
+                if after_id is not None:
+                    stmt = stmt.where(Doctor.id > after_id)
+                stmt = stmt.limit(limit)
+                doctors = await run_in_threadpool(lambda: self.db.scalars(stmt).all())
+                doctor_list = [DoctorRead.model_validate(doctor) for doctor in doctors]
+
+                # A full page means there may be more rows after the last ID
+                next_after = doctor_list[-1].id if len(doctor_list) == limit else None
+                GetAllDoctorsService._doctor_list_cache[cache_key] = (doctor_list, next_after)
+                return doctor_list, next_after
+
+        # Doctors can only view themselves
+        elif role == "doctor":
+            doctor = await run_in_threadpool(self.db.get, Doctor, user_id, options=[raiseload("*")])
+            if not doctor:
+                raise HTTPException(status_code=404, detail="Doctor not found")
+            return [doctor], None
+
+        # If role is invalid or unauthorized
+        else:
+            raise HTTPException(status_code=403, detail="Unauthorized role")
@@ -41,7 +41,7 @@ class GetDoctorByIdService:
             _ = AuthUserCheck.get_user_from_token(token, self.db)
 
             # Fetch doctor from DB by ID
-            doctor = self.db.query(Doctor).filter(Doctor.id == doctor_id).first()
+            doctor = self.db.get(Doctor, doctor_id)
 
             # Raise error if doctor is not found
             if not doctor:
@@ -2,8 +2,14 @@
 # Import HTTPException for raising API-related errors
 from fastapi import HTTPException
 
+# Run blocking DB calls in a worker thread so the event loop stays free
+from fastapi.concurrency import run_in_threadpool
+
 # Import Session type for type hinting the database session
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
+
+# Import SQLAlchemy constructs for a lightweight existence check
+from sqlalchemy import select, exists, func
 
 # ---------------------------- Internal Imports ----------------------------
 # Import the Doctor ORM model
@@ -15,9 +21,21 @@ from ...schemas.doctor_schema import DoctorUpdate
 # Import utility for checking and decoding token
 from ...auth.auth_user_check import AuthUserCheck
 
+# Import auth utilities to invalidate the cached /me identity after writes
+from ...auth.auth_utils import AuthUtils
+
+# Import the Google token service to drop cached tokens after writes
+from ...auth.google_token_service import GoogleTokenService
+
 # Import utility to regenerate slots if availability changes
 from ...utils.slot_availability_utils import SlotAvailabilityUtils
 
+# Import the doctor list service to invalidate its cache after writes
+from .get_all_doctors_service import GetAllDoctorsService
+
+# Import the shared service error-handling decorator
+from ...utils.service_errors import wrap_service_errors
+
 # ---------------------------- Class: UpdateDoctorService ----------------------------
 class UpdateDoctorService:
     """
@@ -31,6 +49,7 @@ class UpdateDoctorService:
         self.db = db
 
     # ---------------------------- Method: update_doctor ----------------------------
+    @wrap_service_errors
     async def update_doctor(
         self,
         doctor_id: int,
@@ -49,53 +68,57 @@ class UpdateDoctorService:
         Returns:
             Doctor: The updated doctor object.
         """
-        try:
-            # Decode the token and extract role
-            _, role, _ = AuthUserCheck.get_user_from_token(token, self.db)
-
-            # Restrict access to admin only
-            if role != "admin":
-                raise HTTPException(status_code=403, detail="Admin access required")
-
-            # Fetch the doctor to be updated
-            doctor = self.db.query(Doctor).filter(Doctor.id == doctor_id).first()
-
-            # Raise 404 if doctor is not found
-            if not doctor:
-                raise HTTPException(status_code=404, detail="Doctor not found")
-
-            # Save previous values to check if slots need to be regenerated
-            old_available_days = doctor.available_days
-            old_slot_duration = doctor.slot_duration
-
-            # Get only the fields provided in the update request
-            update_data = updated_doctor.model_dump(exclude_unset=True)
-
-            # Update doctor object dynamically
-            for key, value in update_data.items():
-                setattr(doctor, key, value)
-
-            # Regenerate weekly slots if availability or duration changed
-            if (
-                ("available_days" in update_data and doctor.available_days != old_available_days) or
-                ("slot_duration" in update_data and doctor.slot_duration != old_slot_duration)
-            ):
-                doctor.weekly_available_slots = SlotAvailabilityUtils.generate_all_weekly_slots(
-                    doctor.available_days,
-                    doctor.slot_duration
-                )
-
-            # Commit the changes to the database
-            self.db.commit()
-            self.db.refresh(doctor)
-
-            # Return the updated doctor object
-            return doctor
-
-        # Propagate FastAPI-specific exceptions
-        except HTTPException:
-            raise
-
-        # Handle and log unexpected server errors
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        # Decode the token and extract role
+        _, role, _ = await run_in_threadpool(AuthUserCheck.get_user_from_token, token, self.db)
+
+        # Restrict access to admin only
+        if role != "admin":
+            raise HTTPException(status_code=403, detail="Admin access required")
+
+        # Fetch the doctor to be updated by primary key (served from the identity map when already loaded)
+        doctor = await run_in_threadpool(self.db.get, Doctor, doctor_id, options=[raiseload("*")])
+
+        # Raise 404 if doctor is not found
+        if not doctor:
+            raise HTTPException(status_code=404, detail="Doctor not found")
+
+        # Save previous values to check if slots need to be regenerated
+        old_available_days = doctor.available_days
+        old_slot_duration = doctor.slot_duration
+
+        # Names of the fields explicitly provided in the update request (no dict is built)
+        fields_set = updated_doctor.model_fields_set
+
+        # Reject an email already used by another doctor (case-insensitive, like the lower(email) index)
+        if "email" in fields_set and updated_doctor.email is not None:
+            exists_stmt = select(exists().where(
+                func.lower(Doctor.email) == updated_doctor.email.lower(), Doctor.id != doctor_id
+            ))
+            if await run_in_threadpool(self.db.scalar, exists_stmt):
+                raise HTTPException(status_code=400, detail="Email already in use")
+
+        # Update doctor object dynamically
+        for key in fields_set:
+            setattr(doctor, key, getattr(updated_doctor, key))
+
+        # Regenerate weekly slots if availability or duration changed
+        if (
+            ("available_days" in fields_set and doctor.available_days != old_available_days) or
+            ("slot_duration" in fields_set and doctor.slot_duration != old_slot_duration)
+        ):
+            doctor.weekly_available_slots = SlotAvailabilityUtils.generate_all_weekly_slots(
+                doctor.available_days,
+                doctor.slot_duration
+            )
+
+        # Commit the changes to the database
+        await run_in_threadpool(self.db.commit)
+        await run_in_threadpool(self.db.refresh, doctor)
+
+        # Invalidate the cached doctor list, /me identity, and Google tokens so readers see the change
+        GetAllDoctorsService.invalidate_cache()
+        AuthUtils.invalidate_user_identity("doctor", doctor_id)
+        GoogleTokenService.invalidate_cached_token("doctor", doctor_id)
+
+        # Return the updated doctor object
+        return doctor
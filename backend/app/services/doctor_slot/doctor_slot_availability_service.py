@@ -57,7 +57,7 @@ class DoctorSlotAvailabilityService:
                 raise HTTPException(status_code=400, detail="Invalid date format")
 
             # Retrieve the doctor by ID from the database
-            doctor = self.db.query(Doctor).filter(Doctor.id == doctor_id).first()
+            doctor = self.db.get(Doctor, doctor_id)
 
             # Raise 404 if doctor is not found
             if not doctor:
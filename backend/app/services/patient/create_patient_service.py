@@ -2,9 +2,15 @@
 # Import HTTPException for raising API errors
 from fastapi import HTTPException
 
+# Run blocking DB calls in a worker thread so the event loop stays free
+from fastapi.concurrency import run_in_threadpool
+
 # Import SQLAlchemy session for database operations
 from sqlalchemy.orm import Session
 
+# Import SQLAlchemy constructs for a lightweight existence check
+from sqlalchemy import select, exists, func
+
 # ---------------------------- Internal Imports ----------------------------
 # Import the Patient SQLAlchemy model
 from ...models.patient_model import Patient
@@ -15,6 +21,9 @@ from ...schemas.patient_schema import PatientCreate
 # Import centralized auth function to extract identity from JWT token
 from ...auth.auth_user_check import AuthUserCheck
 
+# Import the shared service error-handling decorator
+from ...utils.service_errors import wrap_service_errors
+
 # ---------------------------- Class: CreatePatientService ----------------------------
 class CreatePatientService:
     """
@@ -27,6 +36,7 @@ class CreatePatientService:
         self.db = db
 
     # ---------------------------- Method: create_patient ----------------------------
+    @wrap_service_errors
     async def create_patient(
         self,
         patient_data: PatientCreate,  # Pydantic model containing patient creation fields
@@ -35,34 +45,25 @@ class CreatePatientService:
         """
         Create a new patient if they don't already exist.
         """
-        try:
-            # Validate the token and extract user identity (auth required but no role restriction)
-            _, _, _ = AuthUserCheck.get_user_from_token(token, self.db)
-
-            # Check if a patient already exists with the same email
-            existing = self.db.query(Patient).filter(Patient.email == patient_data.email).first()
-            if existing:
-                raise HTTPException(status_code=400, detail="Patient already exists")
-
-            # Create a new Patient object from validated input
-            new_patient = Patient(**patient_data.model_dump())
+        # Validate the token and extract user identity (auth required but no role restriction)
+        _, _, _ = await run_in_threadpool(AuthUserCheck.get_user_from_token, token, self.db)
 
-            # Add the new patient to the session
-            self.db.add(new_patient)
+        # Check case-insensitively, matching the lower(email) unique index (no row is materialized)
+        exists_stmt = select(exists().where(func.lower(Patient.email) == patient_data.email.lower()))
+        if await run_in_threadpool(self.db.scalar, exists_stmt):
+            raise HTTPException(status_code=400, detail="Patient already exists")
 
-            # Commit the transaction to persist changes
-            self.db.commit()
+        # Create a new Patient object from validated input
+        new_patient = Patient(**patient_data.model_dump())
 
-            # Refresh to get the new patient's DB-generated fields (e.g., ID)
-            self.db.refresh(new_patient)
+        # Add the new patient to the session
+        self.db.add(new_patient)
 
-            # Return the newly created patient record
-            return new_patient
+        # Commit the transaction to persist changes
+        await run_in_threadpool(self.db.commit)
 
-        # Let FastAPI propagate any known HTTP errors as-is
-        except HTTPException as http_exc:
-            raise http_exc
+        # Refresh to get the new patient's DB-generated fields (e.g., ID)
+        await run_in_threadpool(self.db.refresh, new_patient)
 
-        # Catch and re-raise any unexpected server-side errors
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        # Return the newly created patient record
+        return new_patient
@@ -15,6 +15,12 @@ from ...schemas.patient_schema import PatientDeleteResponse
 # Import centralized JWT helper to extract user email, role, and ID
 from ...auth.auth_user_check import AuthUserCheck
 
+# Import auth utilities to invalidate the cached /me identity after writes
+from ...auth.auth_utils import AuthUtils
+
+# Import the Google token service to drop cached tokens after writes
+from ...auth.google_token_service import GoogleTokenService
+
 # ---------------------------- Class: DeletePatientService ----------------------------
 class DeletePatientService:
     """
@@ -52,7 +58,7 @@ class DeletePatientService:
                 raise HTTPException(status_code=403, detail="Only admin can delete patients")
 
             # Query the database to fetch the patient record by ID
-            patient = self.db.query(Patient).filter(Patient.id == patient_id).first()
+            patient = self.db.get(Patient, patient_id)
 
             # Raise a 404 error if no such patient exists
             if not patient:
@@ -62,6 +68,10 @@ class DeletePatientService:
             self.db.delete(patient)
             self.db.commit()
 
+            # Drop the cached /me identity and Google tokens for the deleted patient
+            AuthUtils.invalidate_user_identity("patient", patient_id)
+            GoogleTokenService.invalidate_cached_token("patient", patient_id)
+
             # Return a success response with the deleted patient's ID
             return PatientDeleteResponse(
                 message="Patient deleted successfully",
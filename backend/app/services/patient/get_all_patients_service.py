@@ -2,8 +2,12 @@
 # Import HTTPException to handle error responses
 from fastapi import HTTPException
 
-# Import SQLAlchemy Session for database operations
-from sqlalchemy.orm import Session
+# Run blocking DB calls in a worker thread so the event loop stays free
+from fastapi.concurrency import run_in_threadpool
+
+# Import SQLAlchemy select construct and Session for database operations
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session, raiseload
 
 # ---------------------------- Internal Imports ----------------------------
 # Import the Patient SQLAlchemy model
@@ -12,6 +16,16 @@ from ...models.patient_model import Patient
 # Import the centralized auth utility to extract user info from token
 from ...auth.auth_user_check import AuthUserCheck
 
+# Import the shared service error-handling decorator
+from ...utils.service_errors import wrap_service_errors
+
+# ---------------------------- Statements ----------------------------
+# Base patient list statement, built once so every request reuses the same construct
+_PATIENT_PAGE_STMT = select(Patient).options(raiseload("*")).order_by(Patient.id)
+
+# Own-profile lookup by email, bound per request with the caller's lowercased email (served by the lower(email) index)
+_PATIENT_BY_EMAIL_STMT = select(Patient).options(raiseload("*")).where(func.lower(Patient.email) == bindparam("email"))
+
 # ---------------------------- Class: GetAllPatientsService ----------------------------
 class GetAllPatientsService:
     """
@@ -25,38 +39,43 @@ class GetAllPatientsService:
         self.db = db
 
     # ---------------------------- Method: get_all_patients ----------------------------
-    async def get_all_patients(self, token: str):
+    @wrap_service_errors
+    async def get_all_patients(self, token: str, after_id: int | None = None, limit: int = 50):
         """
-        Retrieve patient records based on the user's role.
+        Retrieve a page of patient records based on the user's role, using keyset pagination on ID.
 
         Args:
             token (str): Bearer token containing user credentials.
+            after_id (int | None): Return only patients with an ID greater than this cursor.
+            limit (int): Maximum number of patients to return.
 
         Returns:
-            list[Patient]: A list of patient records.
+            tuple[list[Patient], int | None]: Patient records and the cursor for the
+            next page, or None when this is the last page.
         """
-        try:
-            # Extract the user's email and role from the JWT token
-            user_email, role, _ = AuthUserCheck.get_user_from_token(token, self.db)
-
-            # If user is an admin, return all patients in the database
-            if role == "admin":
-                return self.db.query(Patient).all()
+        # Extract the user's email and role from the JWT token
+        user_email, role, _ = await run_in_threadpool(AuthUserCheck.get_user_from_token, token, self.db)
 
-            # If the user is a patient, return only their own profile
-            patient = self.db.query(Patient).filter(Patient.email == user_email).first()
+        # If user is an admin, return the next page of patients ordered by ID
+        if role == "admin":
+            stmt = _PATIENT_PAGE_STMT
+            if after_id is not None:
+                stmt = stmt.where(Patient.id > after_id)
+            stmt = stmt.limit(limit)
+            patients = await run_in_threadpool(lambda: self.db.scalars(stmt).all())
 
-            # If no matching patient is found, raise a 404 error
-            if not patient:
-                raise HTTPException(status_code=404, detail="Patient not found")
+            # A full page means there may be more rows after the last ID
+            next_after = patients[-1].id if len(patients) == limit else None
+            return patients, next_after
 
-            # Return the single patient in a list to match the expected format
-            return [patient]
+        # If the user is a patient, return only their own profile (email is unique, so at most one row)
+        patient = await run_in_threadpool(
+            lambda: self.db.scalars(_PATIENT_BY_EMAIL_STMT, {"email": user_email.lower()}).one_or_none()
+        )
 
-        # Re-raise any known HTTP exceptions
-        except HTTPException as http_exc:
-            raise http_exc
+        # If no matching patient is found, raise a 404 error
+        if not patient:
+            raise HTTPException(status_code=404, detail="Patient not found")
 
-        # Handle unexpected exceptions with a generic 500 response
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        # Return the single patient in a list to match the expected format
+        return [patient], None
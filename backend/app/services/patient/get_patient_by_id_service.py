@@ -41,14 +41,14 @@ class GetPatientByIDService:
             user_email, role, _ = AuthUserCheck.get_user_from_token(token, self.db)
 
             # Query the database for the patient with the given ID
-            patient = self.db.query(Patient).filter(Patient.id == patient_id).first()
+            patient = self.db.get(Patient, patient_id)
 
             # If patient is not found, raise a 404 error
             if not patient:
                 raise HTTPException(status_code=404, detail="Patient not found")
 
-            # If the user is not an admin and not the owner of the data, deny access
-            if role != "admin" and patient.email != user_email:
+            # If the user is not an admin and not the owner of the data, deny access (emails compare case-insensitively)
+            if role != "admin" and patient.email.lower() != user_email.lower():
                 raise HTTPException(status_code=403, detail="Access denied")
 
             # Return the patient record if access is permitted
@@ -5,6 +5,9 @@ from fastapi import HTTPException
 # SQLAlchemy session for interacting with the database
 from sqlalchemy.orm import Session
 
+# Import SQLAlchemy constructs for a lightweight existence check
+from sqlalchemy import select, exists, func
+
 # ---------------------------- Internal Imports ----------------------------
 # Import Patient model for querying and updating patient records
 from ...models.patient_model import Patient
@@ -15,6 +18,12 @@ from ...schemas.patient_schema import PatientUpdate
 # Utility to extract authenticated user info from token
 from ...auth.auth_user_check import AuthUserCheck
 
+# Import auth utilities to invalidate the cached /me identity after writes
+from ...auth.auth_utils import AuthUtils
+
+# Import the Google token service to drop cached tokens after writes
+from ...auth.google_token_service import GoogleTokenService
+
 # ---------------------------- Class: UpdatePatientService ----------------------------
 class UpdatePatientService:
     """
@@ -49,18 +58,30 @@ class UpdatePatientService:
         user_email, role, _ = AuthUserCheck.get_user_from_token(token, self.db)
 
         # Query the database for the patient with the specified ID
-        patient = self.db.query(Patient).filter(Patient.id == patient_id).first()
+        patient = self.db.get(Patient, patient_id)
 
         # If no patient is found, raise a 404 error
         if not patient:
             raise HTTPException(status_code=404, detail="Patient not found")
 
-        # If the user is not an admin and not the patient themselves, deny access
-        if role != "admin" and patient.email != user_email:
+        # If the user is not an admin and not the patient themselves, deny access (emails compare case-insensitively)
+        if role != "admin" and patient.email.lower() != user_email.lower():
             raise HTTPException(status_code=403, detail="Access denied")
 
+        # Fields explicitly provided in the update request
+        changes = update_data.model_dump(exclude_unset=True)
+
+        # Reject an email already used by another patient (case-insensitive, like the lower(email) index)
+        new_email = changes.get("email")
+        if new_email is not None:
+            exists_stmt = select(exists().where(
+                func.lower(Patient.email) == new_email.lower(), Patient.id != patient_id
+            ))
+            if self.db.scalar(exists_stmt):
+                raise HTTPException(status_code=400, detail="Email already in use")
+
         # Loop through each field to be updated and apply the changes to the patient object
-        for key, value in update_data.model_dump(exclude_unset=True).items():
+        for key, value in changes.items():
             setattr(patient, key, value)
 
         # Commit the changes to the database
@@ -69,5 +90,9 @@ class UpdatePatientService:
         # Refresh the patient instance to reflect the updated state
         self.db.refresh(patient)
 
+        # Drop the cached /me identity and Google tokens so name, email, or token changes show up immediately
+        AuthUtils.invalidate_user_identity("patient", patient_id)
+        GoogleTokenService.invalidate_cached_token("patient", patient_id)
+
         # Return the updated patient object
         return patient
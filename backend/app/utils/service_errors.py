@@ -0,0 +1,46 @@
+# ------------------------------------- External Imports -------------------------------------
+# For preserving the wrapped method's name, docstring, and signature
+from functools import wraps
+
+# For server-side logging of unexpected service failures
+import logging
+
+# For raising API-related errors
+from fastapi import HTTPException
+
+# ------------------------------------- Logger -------------------------------------
+# Module logger for unexpected service exceptions
+logger = logging.getLogger(__name__)
+
+# ------------------------------------- Decorator: wrap_service_errors -------------------------------------
+def wrap_service_errors(fn):
+    """
+    Wrap an async service method with the shared error-handling policy.
+
+    HTTPExceptions raised by the method propagate unchanged. Any other exception is
+    logged with its traceback and replaced by a generic 500 so internals are not
+    leaked to the client.
+
+    Args:
+        fn (Callable): The async service method to wrap.
+
+    Returns:
+        Callable: The wrapped async method.
+    """
+
+    @wraps(fn)
+    async def inner(*args, **kwargs):
+        try:
+            # Run the wrapped service method
+            return await fn(*args, **kwargs)
+
+        # Let FastAPI propagate known HTTP errors as-is
+        except HTTPException:
+            raise
+
+        # Log unexpected failures server-side and return a generic error
+        except Exception:
+            logger.exception("Unhandled error in %s", fn.__qualname__)
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    return inner
@@ -0,0 +1,24 @@
+# ------------------------------------- External Imports -------------------------------------
+# For supplying the settings the app reads at import time
+import os
+
+# ------------------------------------- Test Settings -------------------------------------
+# Placeholder values so app.core.settings can load without a .env file
+for _name, _value in {
+    "DATABASE_URL": "sqlite://",
+    "JWT_SECRET": "test-secret",
+    "JWT_ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "REFRESH_TOKEN_EXPIRE_DAYS": "7",
+    "GOOGLE_CLIENT_ID": "test-client-id",
+    "GOOGLE_CLIENT_SECRET": "test-client-secret",
+    "GOOGLE_REDIRECT_URI": "http://localhost/auth/callback",
+    "GOOGLE_SCOPES": "openid,email,profile",
+    "FRONTEND_REDIRECT_URI": "http://localhost/",
+    "BACKEND_URL": "http://localhost:8000",
+    "MCP_URL": "http://localhost:8001",
+    "OLLAMA_MODEL": "llama3",
+    "OLLAMA_TEMPERATURE": "0",
+    "OLLAMA_BASE_URL": "http://localhost:11434",
+}.items():
+    os.environ.setdefault(_name, _value)
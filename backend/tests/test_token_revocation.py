@@ -0,0 +1,47 @@
+# ------------------------------------- External Imports -------------------------------------
+# For building mock clocks
+import types
+
+# For test fixtures
+import pytest
+
+# ------------------------------------- Internal Imports -------------------------------------
+# Module under test
+from app.auth import token_revocation
+from app.auth.token_revocation import TokenRevocationList
+
+# ------------------------------------- Fixtures -------------------------------------
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the module's clock with a controllable one and starts from an empty list."""
+    fake = types.SimpleNamespace(now=1_000_000.0)
+    monkeypatch.setattr(token_revocation, "time", types.SimpleNamespace(time=lambda: fake.now))
+    monkeypatch.setattr(TokenRevocationList, "_revoked", {})
+    monkeypatch.setattr(TokenRevocationList, "_next_purge", 0.0)
+    return fake
+
+# ------------------------------------- Tests -------------------------------------
+def test_revoked_jti_stays_rejected_until_expiry(clock):
+    TokenRevocationList.revoke("target", clock.now + 1800)
+
+    # Flood the list with far more revocations than the old bounded cache held
+    for i in range(150_000):
+        TokenRevocationList.revoke(f"other-{i}", clock.now + 1800)
+
+    clock.now += 1799
+    assert TokenRevocationList.is_revoked("target")
+
+    clock.now += 1
+    assert not TokenRevocationList.is_revoked("target")
+
+def test_expired_entries_are_purged(clock):
+    TokenRevocationList.revoke("old", clock.now + 10)
+
+    clock.now += TokenRevocationList._PURGE_INTERVAL + 10
+    TokenRevocationList.revoke("new", clock.now + 10)
+
+    assert "old" not in TokenRevocationList._revoked
+    assert TokenRevocationList.is_revoked("new")
+
+def test_legacy_token_without_jti_is_not_revoked(clock):
+    assert not TokenRevocationList.is_revoked(None)
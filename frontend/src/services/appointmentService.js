@@ -1,7 +1,7 @@
 // ---------------------------- External Imports ----------------------------
 
 // Centralized Axios instance for API requests
-import API from "../utils/axiosInstance";
+import API, { getAllPages } from "../utils/axiosInstance";
 
 
 // ---------------------------- Appointment API Calls ----------------------------
@@ -26,4 +26,4 @@ export const getAvailableSlots = (doctorId, dateStr) =>
     API.get(`/doctor_slot/${doctorId}/available-slots?date_str=${dateStr}`);
 
 // GET: Fetch all patients (used to map patient_id → patient name)
-export const getAllPatients = () => API.get("/patient/");
+export const getAllPatients = () => getAllPages("/patient/");
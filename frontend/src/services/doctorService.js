@@ -1,13 +1,13 @@
 // ---------------------------- External Imports ----------------------------
 
 // Centralized Axios instance for API requests
-import API from "../utils/axiosInstance";
+import API, { getAllPages } from "../utils/axiosInstance";
 
 
 // ---------------------------- Doctor API Calls ----------------------------
 
-// GET: Fetch all doctors
-export const getAllDoctors = () => API.get("/doctor/");
+// GET: Fetch all doctors (follows pagination cursors)
+export const getAllDoctors = () => getAllPages("/doctor/");
 
 // GET: Fetch a specific doctor by ID
 export const getDoctorById = (id) => API.get(`/doctor/${id}`);
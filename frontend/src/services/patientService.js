@@ -1,13 +1,13 @@
 // ---------------------------- External Imports ----------------------------
 
 // Centralized Axios instance for API requests
-import API from "../utils/axiosInstance";
+import API, { getAllPages } from "../utils/axiosInstance";
 
 
 // ---------------------------- Patient API Calls ----------------------------
 
-// GET: Fetch all patients
-export const getAllPatients = () => API.get("/patient/");
+// GET: Fetch all patients (follows pagination cursors)
+export const getAllPatients = () => getAllPages("/patient/");
 
 // GET: Fetch a specific patient by ID
 export const getPatientById = (id) => API.get(`/patient/${id}`);
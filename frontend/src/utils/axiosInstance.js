@@ -50,5 +50,20 @@ axiosInstance.interceptors.response.use(
     }
 );
 
+// ---------------------------- Paginated GET Helper ----------------------------
+// Fetch every page of a keyset-paginated list endpoint by following the X-Next-After cursor
+export const getAllPages = async (url) => {
+    const data = []; // Accumulated items across pages
+    let afterId = null; // Cursor returned by the previous page
+    do {
+        const response = await axiosInstance.get(url, {
+            params: afterId === null ? {} : { after_id: afterId },
+        });
+        data.push(...response.data);
+        afterId = response.headers["x-next-after"] ?? null; // Absent on the last page
+    } while (afterId !== null);
+    return { data }; // Same shape as an Axios response for existing callers
+};
+
 // ---------------------------- Export Axios Instance ----------------------------
 export default axiosInstance;